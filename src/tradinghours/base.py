@@ -3,7 +3,9 @@ from typing import (
     TYPE_CHECKING,
     Dict,
     Generic,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Tuple,
     Type,
@@ -21,14 +23,50 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+class TupleData(Mapping[str, str]):
+    """Read-only mapping of field names over a stored tuple"""
+
+    __slots__ = ("_field_index", "_values")
+
+    def __init__(self, field_index: Dict[str, int], values: Tuple):
+        self._field_index = field_index
+        self._values = values
+
+    def __getitem__(self, key: str) -> str:
+        return self._values[self._field_index[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._field_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._field_index)
+
+    def __len__(self) -> int:
+        return len(self._field_index)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class BaseObject:
     """Base model objects"""
 
+    _field_index: Dict[str, int] = {}
+
     def __init__(self, data: Dict):
         self.data = data
 
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        fields = getattr(cls, "fields", [])
+        cls._field_index = {
+            current_field.field_name: index
+            for index, current_field in enumerate(fields)
+        }
+
     def to_dict(self) -> Dict:
-        return self.data
+        """Returns a copy of the data backing this object"""
+        return dict(self.data)
 
     def to_tuple(self) -> Tuple:
         all_values = []
@@ -45,6 +83,11 @@ class BaseObject:
             data_dict[current_field.field_name] = current_value
         return cls(data_dict)
 
+    @classmethod
+    def view_from_tuple(cls, data: Tuple):
+        """Wraps a stored tuple without copying its values into a dict"""
+        return cls(TupleData(cls._field_index, data))
+
     @classmethod
     def from_dict(cls, data: Dict):
         normalized = snake_dict(data)
@@ -81,6 +124,7 @@ class Field(Generic[T]):
             owner.fields: List["Field"] = []
         owner.fields.append(self)
         self.field_name = name
+        self._prefixed_keys: Dict[type, str] = {}
 
     def __get__(self, obj, objtype=None) -> T:
         if obj is None:
@@ -89,7 +133,10 @@ class Field(Generic[T]):
         if key in obj.data:
             value = obj.data[key]
         else:
-            key = snake_case(objtype.__name__) + "_" + key
+            key = self._prefixed_keys.get(objtype)
+            if key is None:
+                key = snake_case(objtype.__name__) + "_" + self.field_name
+                self._prefixed_keys[objtype] = key
             value = obj.data.get(key, None)
         if value is None or value == "":
             return None
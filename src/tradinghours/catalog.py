@@ -1,22 +1,37 @@
-from typing import Dict, Generator, Optional, Tuple, Type, TypeVar
+import datetime
+import multiprocessing
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Generator, List, Optional, Tuple, Type, TypeVar
 
 from .base import BaseObject
 from .currency import Currency, CurrencyHoliday
 from .market import Market, MarketHoliday, MicMapping
 from .remote import default_data_manager
 from .schedule import Schedule
-from .store.engine import Store, default_store
-from .store.file import FileCollection
+from .store.engine import Store
+from .store.file import FileCollection, FileCollectionRegistry
 from .store.source import SourceFile
-from .typing import StrOrPath
+from .typing import StrOrDate, StrOrPath
 
 B = TypeVar("B", bound=BaseObject)
 
 
+def _date_to_key(value: StrOrDate) -> str:
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value.partition("T")[0]
+
+
 class DeclaredFile(SourceFile[B]):
     """Well known source file"""
 
     known_files: Dict[str, Type["DeclaredFile"]] = {}
+    known_files_tuple: Tuple[Type["DeclaredFile"], ...] = ()
+    model_to_name: Dict[Type[BaseObject], str] = {}
 
     name: str = None
     model: Type[B] = None
@@ -31,6 +46,8 @@ class DeclaredFile(SourceFile[B]):
         if cls.model is None:
             raise ValueError("model must be defined")
         cls.known_files[cls.name] = cls
+        DeclaredFile.known_files_tuple += (cls,)
+        cls.model_to_name[cls.model] = cls.name
 
     def pre_ingest(self, store: "Store"):
         pass
@@ -41,14 +58,33 @@ class DeclaredFile(SourceFile[B]):
     def resolve_key(self, item: Type[B]) -> Optional[str]:
         return None
 
+    @classmethod
+    def encode_key(cls, key: Any) -> Any:
+        """Converts a lookup key into the form stored by resolve_key"""
+        return key
+
     def ingest(self, store: "Store"):
         self.pre_ingest(store)
+        collection_obj = store.collections.get(self.name)
+        resolve_cluster = self.resolve_cluster
+        resolve_key = self.resolve_key
+
+        # Bucket rows by cluster so each cluster file is written contiguously
+        buckets: Dict[Optional[str], List[Tuple]] = {}
         for current in self.load_iter():
-            collection = self.name
-            cluster = self.resolve_cluster(current)
-            key = self.resolve_key(current)
-            data = current.to_tuple()
-            store.store_tuple(data, collection, cluster=cluster, key=key)
+            cluster = resolve_cluster(current)
+            record = (resolve_key(current), current.to_tuple())
+            bucket = buckets.get(cluster)
+            if bucket is None:
+                buckets[cluster] = [record]
+            else:
+                bucket.append(record)
+
+        for cluster, records in buckets.items():
+            cluster_name = "default" if cluster is None else cluster
+            cluster_obj = collection_obj.clusters.get(cluster_name)
+            cluster_obj.extend(records)
+            cluster_obj.flush()
 
 
 class CurrencyFile(DeclaredFile[Currency]):
@@ -69,6 +105,13 @@ class CurrencyHolidayFile(DeclaredFile[CurrencyHoliday]):
     def resolve_key(self, item: CurrencyHoliday) -> Optional[str]:
         return item.date
 
+    @classmethod
+    def encode_key(cls, key: StrOrDate) -> str:
+        return _date_to_key(key)
+
+    def pre_ingest(self, store: "Store"):
+        store.clear_collection(self.name)
+
 
 class MarketFile(DeclaredFile[Market]):
     name = "markets"
@@ -91,6 +134,13 @@ class MarketHolidayFile(DeclaredFile[MarketHoliday]):
     def resolve_key(self, item: MarketHoliday) -> Optional[str]:
         return item.date
 
+    @classmethod
+    def encode_key(cls, key: StrOrDate) -> str:
+        return _date_to_key(key)
+
+    def pre_ingest(self, store: "Store"):
+        store.clear_collection(self.name)
+
 
 class MicMappingFile(DeclaredFile[MicMapping]):
     name = "mic-mapping"
@@ -121,28 +171,78 @@ class Catalog:
     def __init__(self, store: Store):
         self._store = store
 
+    @classmethod
+    def load_default(cls) -> "Catalog":
+        from .store.engine import default_store
+
+        return cls(default_store)
+
     @property
     def store(self) -> Store:
         return self._store
 
-    def ingest_all(self):
-        for _, declared_class in DeclaredFile.known_files.items():
+    def ingest_all(self, parallel: bool = False):
+        """Ingests all declared files into the store
+
+        With parallel set, file stores ingest each declared file in a
+        separate process. Scripts doing so must guard their entry point
+        with `if __name__ == "__main__"`.
+
+        """
+        if parallel and isinstance(self.store.collections, FileCollectionRegistry):
+            max_workers = min(len(DeclaredFile.known_files_tuple), os.cpu_count() or 1)
+            if max_workers > 1:
+                self.ingest_all_parallel(max_workers)
+                return
+        self.store.clear_outdated()
+        for declared_class in DeclaredFile.known_files_tuple:
             source = declared_class(default_data_manager.csv_dir)
             source.ingest(self.store)
         self.store.flush()
 
+    def ingest_all_parallel(self, max_workers: int):
+        """Ingests each declared file in its own process
+
+        Every declared file writes to its own collection folder, so workers
+        do not share any cluster files. Only file stores support this.
+        Workers are spawned rather than forked, which stays safe while other
+        threads are running and behaves the same on every platform.
+
+        """
+        self.store.clear_outdated()
+        root = self.store.collections.root
+        csv_dir = default_data_manager.csv_dir
+        declared_files = DeclaredFile.known_files_tuple
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(_ingest_declared_file, declared.name, csv_dir, root)
+                for declared in declared_files
+            ]
+            for future in futures:
+                future.result()
+        self.store.refresh()
+
+    def find_model_declared(
+        self, model: Type[BaseObject]
+    ) -> Optional[Type[DeclaredFile]]:
+        name = DeclaredFile.model_to_name.get(model)
+        if name is None:
+            return None
+        return DeclaredFile.known_files[name]
+
     def find_model_collection(self, model: Type[BaseObject]) -> FileCollection:
-        for name, declared in DeclaredFile.known_files.items():
-            if declared.model is model:
-                return self.store.collections.get(name)
-        return None
+        name = DeclaredFile.model_to_name.get(model)
+        if name is None:
+            return None
+        return self.store.collections.get(name)
 
     def list_all(self, model: Type[B]) -> Generator[B, None, None]:
         collection = self.find_model_collection(model)
         for cluster in collection.clusters:
             cluster_data = cluster.load_all()
             for _, current in cluster_data.items():
-                yield model.from_tuple(current)
+                yield model.view_from_tuple(current)
 
     def list(
         self, model: Type[B], cluster: Optional[str] = None
@@ -152,7 +252,7 @@ class Catalog:
         cluster_obj = collection.clusters.get(cluster_name)
         cluster_data = cluster_obj.load_all()
         for current_key, data in cluster_data.items():
-            yield current_key, model.from_tuple(data)
+            yield current_key, model.view_from_tuple(data)
         return None
 
     def get(
@@ -161,11 +261,11 @@ class Catalog:
         collection = self.find_model_collection(model)
         cluster_name = cluster or "default"
         cluster = collection.clusters.get(cluster_name)
-        cluster_data = cluster.load_all()
-        for current_key, data in cluster_data.items():
-            if current_key == key:
-                return model.from_tuple(data)
-        return None
+        key = self.find_model_declared(model).encode_key(key)
+        data = cluster.load_one(key)
+        if data is None:
+            return None
+        return model.from_tuple(data)
 
     def filter(
         self,
@@ -177,20 +277,42 @@ class Catalog:
         collection = self.find_model_collection(model)
         cluster_name = cluster or "default"
         cluster = collection.clusters.get(cluster_name)
-        cluster_data = cluster.load_all()
-        for current_key, data in cluster_data.items():
-            if current_key >= key_start and current_key <= key_end:
-                yield model.from_tuple(data)
+        declared = self.find_model_declared(model)
+        key_start = declared.encode_key(key_start)
+        key_end = declared.encode_key(key_end)
+        cluster_data, sorted_keys = cluster.load_all_sorted()
+        first = bisect_left(sorted_keys, key_start)
+        last = bisect_right(sorted_keys, key_end)
+        for current_key in sorted_keys[first:last]:
+            yield model.view_from_tuple(cluster_data[current_key])
         return None
 
 
-default_catalog = Catalog(default_store)
+def _ingest_declared_file(name: str, csv_dir: StrOrPath, root: StrOrPath):
+    store = Store(FileCollectionRegistry(root))
+    source = DeclaredFile.known_files[name](csv_dir)
+    source.ingest(store)
+    store.flush()
+
+
+_default_catalog: Optional[Catalog] = None
+
+
+def __getattr__(name: str):
+    if name == "default_catalog":
+        global _default_catalog
+        if _default_catalog is None:
+            _default_catalog = Catalog.load_default()
+        return _default_catalog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     from datetime import date
     from time import time
 
+    default_catalog = Catalog.load_default()
+
     print("\nDownloading...")
     start = time()
     default_data_manager.download()
@@ -199,7 +321,7 @@ if __name__ == "__main__":
 
     print("\nImporting...")
     start = time()
-    default_catalog.ingest_all()
+    default_catalog.ingest_all(parallel=True)
     elapsed = time() - start
     print("Elapsed seconds", elapsed)
 
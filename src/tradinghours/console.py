@@ -5,8 +5,7 @@ from contextlib import contextmanager
 from textwrap import wrap
 from threading import Thread
 
-from tradinghours import __version__
-from tradinghours.catalog import default_catalog
+from tradinghours import __version__, catalog
 from tradinghours.currency import Currency
 from tradinghours.exceptions import TradingHoursError
 from tradinghours.market import Market
@@ -88,11 +87,12 @@ def run_status(args):
 
 
 def run_import(args):
-    if args.force or default_data_manager.needs_download:
+    store = catalog.default_catalog.store
+    if args.force or store.is_outdated or default_data_manager.needs_download:
         with timed_action("Downloading"):
             default_data_manager.download()
         with timed_action("Ingesting"):
-            default_catalog.ingest_all()
+            catalog.default_catalog.ingest_all(parallel=True)
     else:
         print("Local data is up-to-date.")
 
@@ -80,3 +80,13 @@ class TokenError(ClientError):
             "by exporting the environment variable TRADINGHOURS_TOKEN and "
             "try again."
         )
+
+
+class StoreFormatError(TradingHoursError):
+    """When local data was stored in a format this version cannot read"""
+
+    def build_help_message(self):
+        return (
+            "Local data was stored by a different version of this library. "
+            "Run `tradinghours import --force` to import it again."
+        )
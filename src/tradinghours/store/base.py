@@ -1,21 +1,31 @@
 from abc import ABC, abstractmethod, abstractproperty
+from functools import lru_cache
 from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 from ..util import slugify
 
 T = TypeVar("T")
 
+cached_slugify = lru_cache(maxsize=4096)(slugify)
+
 
 class Registry(ABC, Generic[T]):
     """Keeps track of keyed resources"""
 
     def __init__(self):
         self._resources = {}
+        self.refresh()
+
+    def refresh(self):
+        """Picks up resources created since this registry was loaded"""
         for name in self.discover():
             self.get(name)
 
     def get(self, name: str) -> T:
-        slug = slugify(name)
+        resource = self._resources.get(name, None)
+        if resource is not None:
+            return resource
+        slug = cached_slugify(name)
         resource = self._resources.get(slug, None)
         if resource is None:
             resource = self.create(slug)
@@ -58,16 +68,40 @@ class Cluster(ABC):
         if len(self._cached) >= self._cache_size:
             self.flush()
 
+    def extend(self, records: List[Tuple[Optional[str], Tuple]]):
+        """Appends many (key, data) elements to this cluster at once"""
+        self._cached.extend(records)
+        if len(self._cached) >= self._cache_size:
+            self.flush()
+
     @abstractmethod
     def flush(self):
         """Flushes data to the underlying storage"""
         raise NotImplementedError()
 
+    def close(self):
+        """Flushes data and releases resources held by this cluster"""
+        self.flush()
+
     @abstractmethod
     def load_all(self) -> Dict[str, Tuple]:
         """Loads all data from this cluster"""
         raise NotImplementedError()
 
+    @property
+    def is_outdated(self) -> bool:
+        """Whether stored data uses a format this version cannot read"""
+        return False
+
+    def load_one(self, key: str) -> Optional[Tuple]:
+        """Loads a single element from this cluster"""
+        return self.load_all().get(key)
+
+    def load_all_sorted(self) -> Tuple[Dict[str, Tuple], List[str]]:
+        """Loads all data from this cluster along with its sorted keys"""
+        keyed_items = self.load_all()
+        return keyed_items, sorted(keyed_items)
+
 
 class Collection(ABC):
     """Generic Collection interface"""
@@ -4,7 +4,6 @@ from typing import Optional, Tuple
 from tradinghours.config import main_config
 from tradinghours.store.base import Registry
 from tradinghours.store.file import FileCollectionRegistry
-from tradinghours.store.sql import SqlCollectionRegistry
 
 
 class Store:
@@ -38,10 +37,30 @@ class Store:
         cluster_obj = collection_obj.clusters.get(cluster)
         cluster_obj.append(key, data)
 
+    @property
+    def is_outdated(self) -> bool:
+        for collection in self.collections:
+            for cluster in collection.clusters:
+                if cluster.is_outdated:
+                    return True
+        return False
+
+    def clear_outdated(self):
+        """Truncates clusters stored in a format this version cannot read"""
+        for collection in self.collections:
+            for cluster in collection.clusters:
+                if cluster.is_outdated:
+                    cluster.truncate()
+
     def flush(self):
         for collection in self.collections:
             for cluster in collection.clusters:
-                cluster.flush()
+                cluster.close()
+
+    def refresh(self):
+        self.collections.refresh()
+        for collection in self.collections:
+            collection.clusters.refresh()
 
 
 def create_file_store():
@@ -52,6 +71,8 @@ def create_file_store():
 
 
 def create_sql_store():
+    from tradinghours.store.sql import SqlCollectionRegistry
+
     db_url = main_config.get("data", "db_url")
     registry = SqlCollectionRegistry(db_url)
     store = Store(registry)
@@ -65,4 +86,13 @@ def create_default_store():
         return create_file_store()
 
 
-default_store = create_default_store()
+_default_store: Optional[Store] = None
+
+
+def __getattr__(name: str):
+    if name == "default_store":
+        global _default_store
+        if _default_store is None:
+            _default_store = create_default_store()
+        return _default_store
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
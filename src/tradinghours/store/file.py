@@ -1,49 +1,187 @@
-import csv
+import os
+import pickle
+import struct
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
 
+from tradinghours.exceptions import StoreFormatError
 from tradinghours.store.base import Cluster, Collection, Registry
 from tradinghours.typing import StrOrPath
 from tradinghours.validate import validate_path_arg
 
+FILE_MAGIC = b"THDAT001"
+FRAME_HEADER = struct.Struct("<I")
+
+
+def encode_record(
+    key: Optional[str], data: Tuple, shared_values: Dict[str, str]
+) -> Tuple:
+    """Normalizes one record to the key and string values that are stored
+
+    Equal values are replaced by the same string object from shared_values,
+    so pickling a batch writes each distinct value once and refers back to
+    it afterwards, much like a dictionary-encoded column.
+
+    """
+    if key is not None:
+        key = str(key)
+    values = tuple(
+        shared_values.setdefault(value, value)
+        for value in ("" if value is None else str(value) for value in data)
+    )
+    return key, values
+
+
+def encode_frames(batch: List[Tuple]) -> List[bytes]:
+    """Serializes a batch of encoded records as one length-prefixed frame"""
+    payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+    return [FRAME_HEADER.pack(len(payload)), payload]
+
+
+def write_frames(fd: int, frames: List[bytes]):
+    """Writes all frames to a file descriptor, gathering them when possible"""
+    if hasattr(os, "writev"):
+        frames = list(frames)
+    else:
+        frames = [b"".join(frames)]
+    while frames:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, frames)
+        else:
+            written = os.write(fd, frames[0])
+        while frames and written >= len(frames[0]):
+            written -= len(frames[0])
+            frames.pop(0)
+        if written:
+            frames[0] = memoryview(frames[0])[written:]
+
 
 class FileCluster(Cluster):
     """Manages one page file with items for a collection"""
 
-    DEFAULT_CACHE_SIZE = 500
+    DEFAULT_CACHE_SIZE = 4096
+    MAX_LOADED_CLUSTERS = 64
+    MAX_OPEN_WRITERS = 128
+
+    _recently_loaded: "OrderedDict[FileCluster, None]" = OrderedDict()
+    _open_writers: "OrderedDict[FileCluster, None]" = OrderedDict()
 
     def __init__(self, location: StrOrPath, cache_size: Optional[int] = None):
         self._location = validate_path_arg("location", location)
         self._cached: List[str, Tuple] = []
         self._cache_size = cache_size or self.DEFAULT_CACHE_SIZE
+        self._loaded: Optional[Tuple[Tuple, Dict, Optional[List[str]]]] = None
+        self._fd: Optional[int] = None
 
     @property
     def location(self) -> Path:
         return self._location
 
     def truncate(self):
-        with open(self.location, "a+", encoding="utf-8", newline="") as file:
-            file.seek(0)
+        self._cached = []
+        self._close_fd()
+        with open(self.location, "ab") as file:
             file.truncate(0)
+        self._loaded = None
 
     def flush(self):
-        with open(self.location, "a+", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            for key, data in self._cached:
-                row = [key, *data]
-                writer.writerow(row)
-            self._cached = []
+        if not self._cached:
+            return
+        shared_values: Dict[str, str] = {}
+        batch = [
+            encode_record(key, data, shared_values) for key, data in self._cached
+        ]
+        if self._fd is None and self.is_outdated:
+            self.truncate()
+        fd = self._get_fd()
+        frames = encode_frames(batch)
+        if not os.fstat(fd).st_size:
+            frames.insert(0, FILE_MAGIC)
+        write_frames(fd, frames)
+        self._cached = []
+        self._loaded = None
+
+    def close(self):
+        self.flush()
+        self._close_fd()
+
+    def _close_fd(self):
+        if self._fd is not None:
+            FileCluster._open_writers.pop(self, None)
+            os.close(self._fd)
+            self._fd = None
+
+    def _get_fd(self) -> int:
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            self._fd = os.open(self.location, flags, 0o666)
+            open_writers = FileCluster._open_writers
+            open_writers[self] = None
+            while len(open_writers) > self.MAX_OPEN_WRITERS:
+                oldest = next(iter(open_writers))
+                oldest._close_fd()
+        return self._fd
 
     def load_all(self) -> Dict[str, Tuple]:
+        stamp = self._get_stamp()
+        if self._loaded is None or self._loaded[0] != stamp:
+            self._loaded = (stamp, self._read_all(), None)
+        self._mark_loaded()
+        return self._loaded[1]
+
+    def load_all_sorted(self) -> Tuple[Dict[str, Tuple], List[str]]:
+        keyed_items = self.load_all()
+        stamp, _, sorted_keys = self._loaded
+        if sorted_keys is None:
+            sorted_keys = sorted(keyed_items)
+            self._loaded = (stamp, keyed_items, sorted_keys)
+        return keyed_items, sorted_keys
+
+    def _get_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.location)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _mark_loaded(self):
+        recently_loaded = FileCluster._recently_loaded
+        recently_loaded.pop(self, None)
+        recently_loaded[self] = None
+        while len(recently_loaded) > self.MAX_LOADED_CLUSTERS:
+            oldest, _ = recently_loaded.popitem(last=False)
+            oldest._loaded = None
+
+    @property
+    def is_outdated(self) -> bool:
+        try:
+            with open(self.location, "rb") as file:
+                magic = file.read(len(FILE_MAGIC))
+        except FileNotFoundError:
+            return False
+        return bool(magic) and magic != FILE_MAGIC
+
+    def _iter_frames(self) -> Iterator[List[Tuple]]:
+        header_size = FRAME_HEADER.size
+        with open(self.location, "rb") as file:
+            magic = file.read(len(FILE_MAGIC))
+            if not magic:
+                return
+            if magic != FILE_MAGIC:
+                raise StoreFormatError(f"Unknown format in {self.location}")
+            while True:
+                header = file.read(header_size)
+                if len(header) < header_size:
+                    return
+                (length,) = FRAME_HEADER.unpack(header)
+                yield pickle.loads(file.read(length))
+
+    def _read_all(self) -> Dict[str, Tuple]:
         keyed_items = {}
         next_key = 1
-        with open(self.location, "r", encoding="utf-8", newline="") as file:
-            for row in csv.reader(file):
-                key = row[0] or str(next_key)
+        for batch in self._iter_frames():
+            for key, data in batch:
+                key = key or str(next_key)
                 next_key += 1
-                data = row[1:]
-                if key:
-                    keyed_items[key] = data
+                keyed_items[key] = data
         return keyed_items
 
 
@@ -65,7 +203,7 @@ class FileClusterRegistry(Registry[FileCluster]):
     def discover(self) -> Iterator[str]:
         if self.folder.exists():
             for item in self.folder.iterdir():
-                if item.is_file():
+                if item.is_file() and item.suffix == ".dat":
                     yield item.stem
 
 
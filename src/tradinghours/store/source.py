@@ -4,6 +4,7 @@ from typing import Generator, Generic, Type, TypeVar
 
 from tradinghours.base import BaseObject
 from tradinghours.typing import StrOrPath
+from tradinghours.util import snake_case
 from tradinghours.validate import (
     validate_path_arg,
     validate_str_arg,
@@ -43,5 +44,12 @@ class SourceFile(Generic[B]):
 
     def load_iter(self) -> Generator[B, None, None]:
         with open(self.path, "r", encoding="utf-8-sig", errors="replace") as file:
-            for row in csv.DictReader(file):
-                yield self.model.from_dict(row)
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            field_names = [snake_case(name) for name in header]
+            model = self.model
+            for row in reader:
+                if row:
+                    yield model(dict(zip(field_names, row)))
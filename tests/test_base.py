@@ -0,0 +1,50 @@
+import unittest
+
+from tradinghours.base import TupleData
+from tradinghours.market import MarketHoliday
+
+HOLIDAY_TUPLE = ("US.NYSE", "2023-07-04", "Independence Day", "", "", "", "", "")
+
+
+class TestTupleData(unittest.TestCase):
+    def setUp(self):
+        self.data = TupleData({"a": 0, "b": 1}, ("first", "second"))
+
+    def test_mapping(self):
+        self.assertEqual(self.data["b"], "second")
+        self.assertEqual(list(self.data), ["a", "b"])
+        self.assertEqual(len(self.data), 2)
+        self.assertIn("a", self.data)
+        self.assertNotIn("c", self.data)
+        self.assertEqual(dict(self.data), {"a": "first", "b": "second"})
+
+    def test_missing_keys(self):
+        with self.assertRaises(KeyError):
+            self.data["c"]
+        self.assertIsNone(self.data.get("c"))
+
+
+class TestViewFromTuple(unittest.TestCase):
+    def test_fields_match_from_tuple(self):
+        view = MarketHoliday.view_from_tuple(HOLIDAY_TUPLE)
+        loaded = MarketHoliday.from_tuple(HOLIDAY_TUPLE)
+        for current_field in MarketHoliday.fields:
+            name = current_field.field_name
+            self.assertEqual(getattr(view, name), getattr(loaded, name))
+        self.assertEqual(view.to_tuple(), loaded.to_tuple())
+
+    def test_prefixed_keys(self):
+        holiday = MarketHoliday({"market_holiday_name": "Christmas"})
+        self.assertEqual(holiday.name, "Christmas")
+        view = MarketHoliday(TupleData({"market_holiday_name": 0}, ("Christmas",)))
+        self.assertEqual(view.name, "Christmas")
+        self.assertIsNone(view.memo)
+
+    def test_to_dict_returns_a_copy(self):
+        view = MarketHoliday.view_from_tuple(HOLIDAY_TUPLE)
+        loaded = MarketHoliday.from_tuple(HOLIDAY_TUPLE)
+        self.assertEqual(view.to_dict(), loaded.to_dict())
+        self.assertIsNot(loaded.to_dict(), loaded.data)
+        view_dict = view.to_dict()
+        view_dict["name"] = "Changed"
+        self.assertEqual(view.name, "Independence Day")
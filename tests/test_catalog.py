@@ -0,0 +1,127 @@
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from tradinghours.catalog import Catalog
+from tradinghours.currency import Currency
+from tradinghours.market import Market, MarketHoliday
+from tradinghours.store.engine import Store
+from tradinghours.store.file import FileCollectionRegistry
+
+SOURCE_FILES = {
+    "currencies.csv": "Code,Name\nUSD,US Dollar\nEUR,Euro\n",
+    "currency-holidays.csv": "Currency Code,Date,Name\nUSD,2023-01-02,New Year\n",
+    "markets.csv": "FinID,Exchange\nUS.NYSE,NYSE\nUS.IEX,IEX\n",
+    "holidays.csv": (
+        "FinID,Date,Name\n"
+        "US.NYSE,2023-07-04,Independence Day\n"
+        "US.NYSE,2023-01-02,New Year\n"
+        "US.NYSE,2023-12-25,Christmas\n"
+        "US.NYSE,,Unscheduled Closure\n"
+    ),
+    "mic-mapping.csv": "MIC,FinID\nXNYS,US.NYSE\n",
+    "schedules.csv": "FinID,Schedule Group\n",
+}
+
+
+class TestCatalogIngest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_dir = Path(self.temp_dir.name) / "csv"
+        self.csv_dir.mkdir()
+        for filename, content in SOURCE_FILES.items():
+            (self.csv_dir / filename).write_text(content, encoding="utf-8")
+        data_manager = SimpleNamespace(csv_dir=self.csv_dir)
+        patcher = mock.patch("tradinghours.catalog.default_data_manager", data_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.root = Path(self.temp_dir.name) / "store"
+        self.root.mkdir()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_catalog(self) -> Catalog:
+        return Catalog(Store(FileCollectionRegistry(self.root)))
+
+    def assertIngested(self, catalog: Catalog):
+        market = catalog.get(Market, "US.NYSE", "us")
+        self.assertEqual(market.exchange, "NYSE")
+        currency = catalog.get(Currency, "EUR")
+        self.assertEqual(currency.name, "Euro")
+        codes = sorted(current.code for current in catalog.list_all(Currency))
+        self.assertEqual(codes, ["EUR", "USD"])
+
+    def test_ingest_all(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        self.assertIngested(catalog)
+
+    def test_ingest_all_parallel(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all_parallel(max_workers=2)
+        self.assertIngested(catalog)
+        self.assertIngested(self.create_catalog())
+
+    def test_outdated_clusters_are_cleared(self):
+        legacy = self.root / "markets" / "xx.dat"
+        legacy.parent.mkdir()
+        legacy.write_text("XX.OLD,XX.OLD,Old Exchange\n", encoding="utf-8")
+        catalog = self.create_catalog()
+        self.assertTrue(catalog.store.is_outdated)
+        catalog.ingest_all()
+        self.assertFalse(catalog.store.is_outdated)
+        self.assertIngested(catalog)
+        exchanges = sorted(market.exchange for market in catalog.list_all(Market))
+        self.assertEqual(exchanges, ["IEX", "NYSE"])
+
+    def test_holiday_keys_are_iso_dates(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        keys = [key for key, _ in catalog.list(MarketHoliday, "US.NYSE")]
+        self.assertEqual(keys, ["2023-07-04", "2023-01-02", "2023-12-25", "4"])
+
+    def test_get_and_filter_accept_dates(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        holiday = catalog.get(MarketHoliday, datetime.date(2023, 7, 4), "US.NYSE")
+        self.assertEqual(holiday.name, "Independence Day")
+        holiday = catalog.get(MarketHoliday, "2023-12-25", "US.NYSE")
+        self.assertEqual(holiday.name, "Christmas")
+        holidays = catalog.filter(
+            MarketHoliday, datetime.date(2023, 1, 1), "2023-07-31", "US.NYSE"
+        )
+        names = [current.name for current in holidays]
+        self.assertEqual(names, ["New Year", "Independence Day"])
+
+    def test_get_and_filter_accept_datetimes(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        start = datetime.datetime(2023, 1, 2, 9, 30)
+        holiday = catalog.get(MarketHoliday, start, "US.NYSE")
+        self.assertEqual(holiday.name, "New Year")
+        holidays = catalog.filter(
+            MarketHoliday, start.isoformat(), "2023-12-25T00:00:00", "US.NYSE"
+        )
+        names = [current.name for current in holidays]
+        self.assertEqual(names, ["New Year", "Independence Day", "Christmas"])
+        market = catalog.get(Market, "US.NYSE", "us")
+        end = datetime.datetime(2023, 7, 31)
+        holidays = market.list_holidays(start, end, catalog=catalog)
+        names = [current.name for current in holidays]
+        self.assertEqual(names, ["New Year", "Independence Day"])
+
+    def test_get_unknown_holiday(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        self.assertIsNone(catalog.get(MarketHoliday, "garbage", "US.NYSE"))
+
+    def test_holidays_are_cleared_before_ingest(self):
+        catalog = self.create_catalog()
+        catalog.ingest_all()
+        catalog.ingest_all()
+        holidays = list(catalog.list(MarketHoliday, "US.NYSE"))
+        self.assertEqual(len(holidays), 4)
@@ -0,0 +1,187 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tradinghours.exceptions import StoreFormatError
+from tradinghours.store.file import (
+    FILE_MAGIC,
+    FileCluster,
+    FileCollectionRegistry,
+    write_frames,
+)
+
+
+class TestFileCluster(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.location = Path(self.temp_dir.name) / "cluster.dat"
+        self.cluster = FileCluster(self.location)
+        self.cluster.truncate()
+
+    def tearDown(self):
+        self.cluster.close()
+        self.temp_dir.cleanup()
+
+    def test_roundtrip(self):
+        self.cluster.append("b", ("1", None, 3))
+        self.cluster.append("a", ("x, \"y\"\nz",))
+        self.cluster.flush()
+        loaded = self.cluster.load_all()
+        self.assertEqual(loaded, {"b": ("1", "", "3"), "a": ('x, "y"\nz',)})
+
+    def test_missing_keys_are_numbered(self):
+        self.cluster.append(None, ("first",))
+        self.cluster.append(None, ("second",))
+        self.cluster.flush()
+        loaded = self.cluster.load_all()
+        self.assertEqual(loaded, {"1": ("first",), "2": ("second",)})
+
+    def test_later_records_win(self):
+        self.cluster.append("a", ("old",))
+        self.cluster.flush()
+        self.cluster.append("a", ("new",))
+        self.cluster.flush()
+        self.assertEqual(self.cluster.load_all(), {"a": ("new",)})
+
+    def test_truncate(self):
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        self.cluster.truncate()
+        self.assertEqual(self.cluster.load_all(), {})
+
+    def test_files_start_with_magic(self):
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        self.assertTrue(self.location.read_bytes().startswith(FILE_MAGIC))
+        self.assertFalse(self.cluster.is_outdated)
+
+    def test_outdated_files_are_rejected(self):
+        self.location.write_text("US.NYSE,US.NYSE,US\n", encoding="utf-8")
+        self.assertTrue(self.cluster.is_outdated)
+        with self.assertRaises(StoreFormatError):
+            self.cluster.load_all()
+
+    def test_outdated_files_are_replaced_on_flush(self):
+        self.location.write_text("US.NYSE,US.NYSE,US\n", encoding="utf-8")
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        self.assertFalse(self.cluster.is_outdated)
+        self.assertEqual(self.cluster.load_all(), {"a": ("value",)})
+
+    def test_keys_are_stored_as_strings(self):
+        self.cluster.append(738000, ("value",))
+        self.cluster.flush()
+        self.assertEqual(self.cluster.load_all(), {"738000": ("value",)})
+
+    def test_extend(self):
+        self.cluster.append("a", ("first",))
+        self.cluster.extend([("b", ("second",)), ("c", ("third",))])
+        self.cluster.flush()
+        loaded = self.cluster.load_all()
+        self.assertEqual(list(loaded), ["a", "b", "c"])
+
+    def test_records_span_frames(self):
+        self.cluster.append("b", ("old",))
+        self.cluster.flush()
+        self.cluster.extend([(None, ("unkeyed",)), ("b", ("new",))])
+        self.cluster.flush()
+        loaded = self.cluster.load_all()
+        self.assertEqual(loaded, {"b": ("new",), "2": ("unkeyed",)})
+
+    def test_load_all_is_cached(self):
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        first = self.cluster.load_all()
+        self.assertIs(self.cluster.load_all(), first)
+
+    def test_cache_detects_external_changes(self):
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        self.cluster.load_all()
+        other = FileCluster(self.location)
+        other.append("b", ("other",))
+        other.close()
+        self.assertEqual(self.cluster.load_all(), {"a": ("value",), "b": ("other",)})
+
+    def test_least_recently_loaded_are_evicted(self):
+        self.cluster.append("a", ("value",))
+        self.cluster.flush()
+        self.cluster.load_all()
+        for index in range(FileCluster.MAX_LOADED_CLUSTERS):
+            other = FileCluster(Path(self.temp_dir.name) / f"other{index}.dat")
+            other.truncate()
+            other.load_all()
+        self.assertIsNone(self.cluster._loaded)
+
+    def test_load_all_sorted(self):
+        for key in ["2023-03-01", "2023-01-01", "2023-02-01"]:
+            self.cluster.append(key, (key,))
+        self.cluster.flush()
+        self.cluster.load_all()
+        self.assertIsNone(self.cluster._loaded[2])
+        keyed_items, sorted_keys = self.cluster.load_all_sorted()
+        self.assertEqual(sorted_keys, ["2023-01-01", "2023-02-01", "2023-03-01"])
+        self.assertEqual(set(keyed_items), set(sorted_keys))
+        self.assertIs(self.cluster.load_all_sorted()[1], sorted_keys)
+
+    def test_writers_are_closed_beyond_limit(self):
+        clusters = []
+        for index in range(FileCluster.MAX_OPEN_WRITERS + 1):
+            cluster = FileCluster(Path(self.temp_dir.name) / f"writer{index}.dat")
+            cluster.append(str(index), ("value",))
+            cluster.flush()
+            clusters.append(cluster)
+        self.assertIsNone(clusters[0]._fd)
+        self.assertIsNotNone(clusters[-1]._fd)
+        for cluster in clusters:
+            cluster.close()
+        self.assertEqual(clusters[0].load_all(), {"0": ("value",)})
+
+    def test_write_frames_resumes_short_writes(self):
+        frames = [b"magic", b"", b"header", b"payload"]
+
+        def short_write(fd, buffers):
+            return os.write(fd, bytes(buffers[0])[:3])
+
+        fd = os.open(self.location, os.O_WRONLY | os.O_APPEND)
+        try:
+            with mock.patch("os.writev", short_write, create=True):
+                write_frames(fd, frames)
+        finally:
+            os.close(fd)
+        self.assertEqual(self.location.read_bytes(), b"".join(frames))
+
+    def test_load_one_fills_cache(self):
+        self.cluster.append("a", ("old",))
+        self.cluster.flush()
+        self.cluster.extend([("b", ("second",)), ("a", ("new",))])
+        self.cluster.close()
+        cluster = FileCluster(self.location)
+        self.assertEqual(cluster.load_one("a"), ("new",))
+        self.assertIsNone(cluster.load_one("c"))
+        self.assertIs(cluster.load_all(), cluster._loaded[1])
+
+
+class TestFileCollectionRegistry(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_refresh_discovers_new_clusters(self):
+        registry = FileCollectionRegistry(self.root)
+        other = FileCollectionRegistry(self.root)
+        cluster = other.get("holidays").clusters.get("US.NYSE")
+        cluster.append("2023-01-01", ("value",))
+        cluster.close()
+        self.assertEqual(list(registry), [])
+        registry.refresh()
+        for collection in registry:
+            collection.clusters.refresh()
+        clusters = list(registry.get("holidays").clusters)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0].load_all(), {"2023-01-01": ("value",)})